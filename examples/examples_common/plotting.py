@@ -21,6 +21,10 @@ Default is yes.
 Disable the display window with MQNS_PLTSHOW=0 environment variable.
 """
 
+if not want_show:
+    # Figures are only saved; skip loading a GUI toolkit.
+    plt.switch_backend("agg")
+
 type Axes1D = Sequence[Axes]
 """
 1-dimensional array of Axes.
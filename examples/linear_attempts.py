@@ -124,18 +124,7 @@ def run_row(args: Args, M: int, link_arch: LinkArchLiteral) -> list[list[Channel
     return row
 
 
-def gather_channel_stats(row: list[list[ChannelResult]], i: int) -> dict:
-    ch_res = [res[i] for res in row]
-    d = {
-        "L": ch_res[0]["L"],
-        "M": ch_res[0]["M"],
-        "link_arch": ch_res[0]["link_arch"],
-    }
-    for col in ("Attempts", "Entanglement", "Success"):
-        a = [res[col] for res in ch_res]
-        d[f"{col} rate"] = np.mean(a)
-        d[f"{col} std"] = np.std(a)
-    return d
+RATE_COLUMNS = ("Attempts", "Entanglement", "Success")
 
 
 def convert_results(table: list[list[list[ChannelResult]]]) -> pd.DataFrame:
@@ -152,10 +141,16 @@ def convert_results(table: list[list[list[ChannelResult]]]) -> pd.DataFrame:
     }
 
     for row in table:
-        for i_link in range(len(row[0])):
-            stats = gather_channel_stats(row, i_link)
-            for col, val in stats.items():
-                data[col].append(val)
+        # [run, link, column]
+        samples = np.array([[[res[col] for col in RATE_COLUMNS] for res in run] for run in row], dtype=np.float64)
+        means, stds = samples.mean(axis=0), samples.std(axis=0)
+        for ch, ch_means, ch_stds in zip(row[0], means, stds, strict=True):
+            data["L"].append(ch["L"])
+            data["M"].append(ch["M"])
+            data["link_arch"].append(ch["link_arch"])
+            for col, mean, std in zip(RATE_COLUMNS, ch_means, ch_stds, strict=True):
+                data[f"{col} rate"].append(mean)
+                data[f"{col} std"].append(std)
 
     return pd.DataFrame(data)
 
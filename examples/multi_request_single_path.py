@@ -18,7 +18,9 @@ on end-to-end throughput and average state fidelity for both paths, outputting c
 and JSON data summaries.
 """
 
+import itertools
 import json
+from multiprocessing import Pool, freeze_support
 from typing import NamedTuple, cast
 
 import numpy as np
@@ -35,6 +37,7 @@ log.set_default_level("CRITICAL")
 
 
 class Args(Tap):
+    workers: int = 1  # number of workers for parallel execution
     runs: int = 3  # number of trials per parameter set
     sim_duration: float = 3  # simulation duration in seconds
     json: str = ""  # save results as JSON file
@@ -45,37 +48,37 @@ SEED_BASE = 100
 PATH_TITLES = ("S1-D1", "S2-D2")
 N_PATHS = len(PATH_TITLES)
 
-# Quantum channel lengths
-ch_S1_R1 = 10
-ch_R1_R2 = 10
-ch_R2_R3 = 10
-ch_R3_D1 = 10
-ch_S2_R2 = 10
-ch_R3_D2 = 10
-
-
-def run_simulation(seed: int, args: Args, mux: MuxScheme, t_cohere: float):
-    rng.reseed(seed)
-
-    net = (
+# Quantum channels and their lengths, shared by every parameter set.
+# Only t_cohere and the multiplexing scheme vary across the sweep.
+CHANNELS: list[tuple[str, float]] = [
+    ("S1-R1", 10),
+    ("R1-R2", 10),
+    ("R2-R3", 10),
+    ("R3-D1", 10),
+    ("S2-R2", 10),
+    ("R3-D2", 10),
+]
+
+
+def make_builder(mux: MuxScheme, t_cohere: float) -> NetworkBuilder:
+    """
+    Define the scenario once per parameter set.
+    Only the seed varies across runs; the same builder serves every run.
+    """
+    return (
         NetworkBuilder()
-        .topo(
-            channels=[
-                ("S1-R1", ch_S1_R1),
-                ("R1-R2", ch_R1_R2),
-                ("R2-R3", ch_R2_R3),
-                ("R3-D1", ch_R3_D1),
-                ("S2-R2", ch_S2_R2),
-                ("R3-D2", ch_R3_D2),
-            ],
-            t_cohere=t_cohere,
-        )
+        .topo(channels=CHANNELS, t_cohere=t_cohere)
         .proactive_centralized(mux=mux)
         .request("S1-D1")
         .request("S2-D2")
-        .make_network()
     )
 
+
+def run_simulation(seed: int, args: Args, builder: NetworkBuilder):
+    rng.reseed(seed)
+
+    net = builder.make_network()
+
     s = Simulator(0, args.sim_duration + CTRL_DELAY, accuracy=1000000, install_to=(log, net))
     s.run()
 
@@ -96,21 +99,19 @@ class PathStats(NamedTuple):
 
 
 def run_row(args: Args, strategy: str, t_cohere: float) -> list[PathStats]:
-    mux = STRATEGIES[strategy]
+    builder = make_builder(STRATEGIES[strategy], t_cohere)
 
-    path_rates: list[list[float]] = [[] for _ in range(N_PATHS)]
-    path_fids: list[list[float]] = [[] for _ in range(N_PATHS)]
+    # [run, path, (rate, fid)]
+    samples = np.empty((args.runs, N_PATHS, 2), dtype=np.float64)
 
     for i in range(args.runs):
         print(f"{strategy}, T_cohere={t_cohere:.3f}, run #{i}")
-        res = run_simulation(SEED_BASE + i, args, mux, t_cohere)
-        for path, (rate, fid) in enumerate(res):
-            path_rates[path].append(rate)
-            path_fids[path].append(fid)
+        samples[i] = run_simulation(SEED_BASE + i, args, builder)
 
+    means, stds = samples.mean(axis=0), samples.std(axis=0)
     return [
-        PathStats(np.mean(rates).item(), np.std(rates).item(), np.mean(fids).item(), np.std(fids).item())
-        for rates, fids in zip(path_rates, path_fids, strict=True)
+        PathStats(rate_mean, rate_std, fid_mean, fid_std)
+        for (rate_mean, fid_mean), (rate_std, fid_std) in zip(means.tolist(), stds.tolist(), strict=True)
     ]
 
 
@@ -164,7 +165,7 @@ def plot(results: dict[str, list[list[PathStats]]], *, save_plt: str):
 
     axs[1, -1].legend(title="Strategy", loc="lower right")
     fig.tight_layout(rect=(0, 0, 1, 0.95))
-    plt_save(args.plt)
+    plt_save(save_plt)
 
 
 # Simulation constants
@@ -176,15 +177,18 @@ STRATEGIES: dict[str, MuxScheme] = {
 T_COHERE_VALUES = [5e-3, 10e-3, 20e-3]
 
 if __name__ == "__main__":
+    freeze_support()
     args = Args().parse_args()
 
+    # Rows are independent; run them in parallel.
+    with Pool(processes=args.workers) as pool:
+        rows = pool.starmap(run_row, itertools.product([args], STRATEGIES, T_COHERE_VALUES))
+
     results: dict[str, list[list[PathStats]]] = {}  # strategy->path->t_cohere_index
-    for strategy in STRATEGIES:
-        results[strategy] = [[] for _ in PATH_TITLES]
-        for t_cohere in T_COHERE_VALUES:
-            row = run_row(args, strategy, t_cohere)
-            for path, stats in enumerate(row):
-                results[strategy][path].append(stats)
+    for (strategy, _), row in zip(itertools.product(STRATEGIES, T_COHERE_VALUES), rows, strict=True):
+        strategy_results = results.setdefault(strategy, [[] for _ in PATH_TITLES])
+        for path, stats in enumerate(row):
+            strategy_results[path].append(stats)
 
     if args.json:
         with open(args.json, "w") as file:
@@ -22,7 +22,9 @@ Five swapping strategies are tested:
 The results are end-to-end throughput of each scenario.
 """
 
+import itertools
 import json
+from multiprocessing import Pool, freeze_support
 from typing import cast
 
 import numpy as np
@@ -38,6 +40,13 @@ from examples_common.plotting import Axes1D, mpl, plt, plt_save
 log.set_default_level("CRITICAL")
 
 
+class Args(Tap):
+    workers: int = 1  # number of workers for parallel execution
+    runs: int = 3  # number of trials per parameter set
+    json: str = ""  # save results as JSON file
+    plt: str = ""  # save plot as image file
+
+
 SEED_BASE = 100
 N_NODES = 6
 TOTAL_QUBITS = 6
@@ -46,6 +55,14 @@ CHANNEL_LENGTHS: list[float] = [32, 18, 35, 16, 24]
 # parameters
 sim_duration = 3
 
+# Define swapping policies to test
+swapping_order_configs: list[SwapPolicy] = ["baln", "baln2", "l2r", "r2l", "asap"]
+ch_capacities_configs = {
+    "[3, 3, 3, 3, 3]": [(3, 3), (3, 3), (3, 3), (3, 3), (3, 3)],
+    "[4, 2, 4, 2, 4]": [(4, 4), (2, 2), (4, 4), (2, 2), (4, 4)],
+}
+t_cohere_values = [5e-3, 10e-3, 20e-3]
+
 
 def run_simulation(
     ch_capacities: list[tuple[int, int]],
@@ -76,10 +93,24 @@ def run_simulation(
     return consume_cnt.get_rate(sim_duration)
 
 
+def run_row(args: Args, mem_label: str, order: SwapPolicy, t_cohere: float) -> tuple[float, float]:
+    print(f">>> Testing order: {order}, Channel Mem allocation: {mem_label}, T_cohere={t_cohere:.3f}")
+    run_rates = [
+        run_simulation(
+            ch_capacities=ch_capacities_configs[mem_label],
+            t_cohere=t_cohere,
+            swapping_order=order,
+            seed=SEED_BASE + i,
+        )
+        for i in range(args.runs)
+    ]
+    return np.mean(run_rates).item(), np.std(run_rates).item()
+
+
 type Results = dict[str, dict[SwapPolicy, dict[float, tuple[float, float]]]]
 
 
-def plot_results(results: Results) -> None:
+def plot_results(results: Results, *, save_plt: str) -> None:
     # Reapply font and style settings for academic clarity
     mpl.rcParams.update(
         {
@@ -126,58 +157,27 @@ def plot_results(results: Results) -> None:
 
     axs[-1].legend(title="Policy", loc="lower right")
     plt.tight_layout()
-    plt_save(args.plt)
+    plt_save(save_plt)
 
 
 ########################### Main #########################
 
 
 if __name__ == "__main__":
-
-    class Args(Tap):
-        runs: int = 3  # number of trials per parameter set
-        json: str = ""  # save results as JSON file
-        plt: str = ""  # save plot as image file
-
+    freeze_support()
     args = Args().parse_args()
 
-    # Define swapping policies to test
-    swapping_order_configs: list[SwapPolicy] = ["baln", "baln2", "l2r", "r2l", "asap"]
-    ch_capacities_configs = {
-        "[3, 3, 3, 3, 3]": [(3, 3), (3, 3), (3, 3), (3, 3), (3, 3)],
-        "[4, 2, 4, 2, 4]": [(4, 4), (2, 2), (4, 4), (2, 2), (4, 4)],
-    }
-    t_cohere_values = [5e-3, 10e-3, 20e-3]
-
-    # Store results: mem_label -> policy -> t_cohere -> list of rates
-    results: Results = {
-        mem_label: {order: {t: (0.0, 0.0) for t in t_cohere_values} for order in swapping_order_configs}
-        for mem_label in ch_capacities_configs
-    }
-
-    for mem_label, mem_allocs in ch_capacities_configs.items():
-        for order in swapping_order_configs:
-            print(f"\n>>> Testing order: {order}, Channel Mem allocation: {mem_label}")
-            for t_cohere in t_cohere_values:
-                run_rates = []
-                for i in range(args.runs):
-                    seed = SEED_BASE + i
-                    swapping_config = order
-
-                    ch_capacities = mem_allocs
-
-                    rate = run_simulation(
-                        ch_capacities=ch_capacities,
-                        t_cohere=t_cohere,
-                        swapping_order=swapping_config,
-                        seed=seed,
-                    )
-                    run_rates.append(rate)
-
-                results[mem_label][order][t_cohere] = (np.mean(run_rates).item(), np.std(run_rates).item())
+    sweep = list(itertools.product(ch_capacities_configs, swapping_order_configs, t_cohere_values))
+    with Pool(processes=args.workers) as pool:
+        rows = pool.starmap(run_row, ((args, *point) for point in sweep))
+
+    # Store results: mem_label -> policy -> t_cohere -> (mean, std) of rates
+    results: Results = {}
+    for (mem_label, order, t_cohere), row in zip(sweep, rows, strict=True):
+        results.setdefault(mem_label, {}).setdefault(order, {})[t_cohere] = row
 
     if args.json:
         with open(args.json, "w") as file:
             json.dump(results, file)
 
-    plot_results(results)
+    plot_results(results, save_plt=args.plt)
@@ -131,7 +131,7 @@ channel_capacity_values = [2, 3]  # include alternative allocations if desired
 
 # What to measure:
 type MetricName = Literal["throughput", "mean_fidelity", "expired_ratio"]
-MEASURES: list[MetricName] = ["throughput", "mean_fidelity", "expired_ratio"]
+MEASURES: frozenset[MetricName] = frozenset(("throughput", "mean_fidelity", "expired_ratio"))
 
 
 # ──────────────────────────────────────────────────────────────────────────────
@@ -52,7 +52,6 @@ from tap import Tap
 
 from mqns.network.builder import CTRL_DELAY, NetworkBuilder
 from mqns.network.fw import ForwarderConsumeCounters, SwapPolicy, SwapSequence, SwapSequenceInput
-from mqns.network.network import QuantumNetwork
 from mqns.network.proactive import compute_vora_swap_sequence
 from mqns.network.protocol.link_layer import LinkLayerCounters
 from mqns.simulator import Simulator
@@ -111,10 +110,14 @@ class ParameterSet:
     def t_cohere_ns(self) -> int:
         return int(self.t_cohere * 1e9)
 
-    def build_network(self) -> QuantumNetwork:
+    def make_builder(self) -> NetworkBuilder:
+        """
+        Define the topology and request for this parameter set.
+        It does not depend on the seed or the run, and is computed once per row.
+        """
         distances = self.compute_distances()
         swap = self.get_swap_sequence()
-        log.info(f"build_network: distances={distances} sum={sum(distances)} swap-sequence={swap}")
+        log.info(f"make_builder: distances={distances} sum={sum(distances)} swap-sequence={swap}")
 
         return (
             NetworkBuilder()
@@ -126,7 +129,6 @@ class ParameterSet:
             )
             .proactive_centralized()
             .request("S-D", swap=swap)
-            .make_network()
         )
 
     def compute_distances(self) -> list[float]:
@@ -184,10 +186,10 @@ def vora_regen_row(p: ParameterSet, num_routers: int, dist_prop: str, indir: str
     )
 
 
-def run_simulation(p: ParameterSet, seed: int) -> tuple[float, float]:
+def run_simulation(p: ParameterSet, builder: NetworkBuilder, seed: int) -> tuple[float, float]:
     rng.reseed(seed)
 
-    net = p.build_network()
+    net = builder.make_network()
 
     s = Simulator(0, p.sim_duration + CTRL_DELAY, accuracy=1000000, install_to=(log, net))
     s.run()
@@ -203,20 +205,17 @@ def run_row(p: ParameterSet, num_routers: int, dist_prop: str, swap_conf: str) -
     Run simulations for one parameter set.
     """
     p = p.clone_with(num_routers, dist_prop, swap_conf)
+    builder = p.make_builder()
 
-    entanglements: list[float] = []
-    expired: list[float] = []
+    # [run, (entanglements, expired)]
+    samples = np.empty((p.n_runs, 2), dtype=np.float64)
     for i in range(p.n_runs):
         print(f"Simulation: {num_routers} routers | {dist_prop} distances | {swap_conf} | run #{i + 1}")
         seed = p.seed_base + i
-        e2e_count, expired_count = run_simulation(p, seed)
-        entanglements.append(e2e_count)
-        expired.append(expired_count)
+        samples[i] = run_simulation(p, builder, seed)
 
-    mean_entg = np.mean(entanglements).item()
-    std_entg = np.std(entanglements).item()
-    mean_exp = np.mean(expired).item()
-    std_exp = np.std(expired).item()
+    (mean_entg, mean_exp), (std_entg, std_exp) = samples.mean(axis=0).tolist(), samples.std(axis=0).tolist()
+    entanglements, expired = samples.T.tolist()
 
     return {
         "Routers": num_routers,
@@ -244,18 +243,18 @@ def save_results(results: list[dict], *, save_csv: str, save_plt: str) -> None:
     x = np.arange(len(x_labels))
     width = 0.2
 
-    for i, num_routers in enumerate(NUM_ROUTERS_OPTIONS):
-        df_subset = df[df["Routers"] == num_routers]
+    # Index once; each bar is then a direct lookup rather than a boolean mask scan.
+    indexed = df.set_index(["Routers", "Distance Distribution", "Swapping Config"]).sort_index()
 
+    def column_values(num_routers: int, swap_conf: str, col: str) -> list[float]:
+        return [indexed.at[(num_routers, dist_prop, swap_conf), col] for dist_prop in x_labels]
+
+    for i, num_routers in enumerate(NUM_ROUTERS_OPTIONS):
         # --- Top Row: Entanglements Per Second ---
         ax1 = axes[0, i]
         for j, swap_conf in enumerate(SWAP_CONFIGS):
-            means = []
-            stds = []
-            for dist_prop in x_labels:
-                row = df_subset[(df_subset["Distance Distribution"] == dist_prop) & (df_subset["Swapping Config"] == swap_conf)]
-                means.append(row["Entanglements Per Second"].values[0])
-                stds.append(row["Entanglements Std"].values[0])
+            means = column_values(num_routers, swap_conf, "Entanglements Per Second")
+            stds = column_values(num_routers, swap_conf, "Entanglements Std")
             ax1.bar(x + j * width, means, width, yerr=stds, label=swap_conf)
 
         ax1.set_title(f"Entanglements/sec - {num_routers} Routers")
@@ -267,12 +266,8 @@ def save_results(results: list[dict], *, save_csv: str, save_plt: str) -> None:
         # --- Bottom Row: Expired Memories Per Entanglement ---
         ax2 = axes[1, i]
         for j, swap_conf in enumerate(SWAP_CONFIGS):
-            means = []
-            stds = []
-            for dist_prop in x_labels:
-                row = df_subset[(df_subset["Distance Distribution"] == dist_prop) & (df_subset["Swapping Config"] == swap_conf)]
-                means.append(row["Expired Memories Per Entanglement"].values[0])
-                stds.append(row["Expired Memories Std"].values[0])
+            means = column_values(num_routers, swap_conf, "Expired Memories Per Entanglement")
+            stds = column_values(num_routers, swap_conf, "Expired Memories Std")
             ax2.bar(x + j * width, means, width, yerr=stds, label=swap_conf)
 
         ax2.set_title(f"Expired Memories/Entg - {num_routers} Routers")
@@ -343,7 +338,12 @@ if __name__ == "__main__":
         p.load_vora(args.vora_load or os.path.join(os.path.dirname(__file__), "vora_evaluation.voraswap.json"))
 
         # Run simulations.
+        # Dispatch the slow rows (more routers) first, one at a time; short rows fill in the tail.
+        # Results are restored to sweep order.
+        sweep = list(itertools.product(NUM_ROUTERS_OPTIONS, DIST_PROPORTIONS, SWAP_CONFIGS))
+        order = sorted(range(len(sweep)), key=lambda i: -sweep[i][0])
         with Pool(processes=args.workers) as pool:
-            results = pool.starmap(run_row, itertools.product([p], NUM_ROUTERS_OPTIONS, DIST_PROPORTIONS, SWAP_CONFIGS))
+            rows = pool.starmap(run_row, ((p, *sweep[i]) for i in order), chunksize=1)
+        results = [row for _, row in sorted(zip(order, rows, strict=True), key=lambda t: t[0])]
 
         save_results(results, save_csv=args.csv, save_plt=args.plt)
@@ -1,4 +1,5 @@
-from typing import TypedDict, Unpack, override
+from logging import DEBUG
+from typing import Any, TypedDict, Unpack, override
 
 from mqns.entity.entity import Entity
 from mqns.entity.node import Node
@@ -61,7 +62,7 @@ class BaseChannel[N: Node](Entity):
         super().install(simulator)
         self._next_send_time = simulator.ts
 
-    def _send(self, *, packet_repr: str, packet_len: int, next_hop: N) -> tuple[bool, Time]:
+    def _send(self, *, packet_kind: str, packet: Any, packet_len: int, next_hop: N) -> tuple[bool, Time]:
         now = self.simulator.tc
 
         if next_hop not in self.node_list:
@@ -72,7 +73,8 @@ class BaseChannel[N: Node](Entity):
 
             if self.max_buffer_size != 0 and send_time > now + self.max_buffer_size / self.bandwidth:
                 # buffer is overflow
-                log.debug(f"{self}: drop {packet_repr} due to overflow")
+                if log.isEnabledFor(DEBUG):
+                    log.debug(f"{self}: drop {packet_kind} {packet} due to overflow")
                 return True, Time.SENTINEL
 
             self._next_send_time = send_time + packet_len / self.bandwidth
@@ -81,7 +83,8 @@ class BaseChannel[N: Node](Entity):
 
         # random drop
         if self.drop_rate > 0 and rng.random() < self.drop_rate:
-            log.debug(f"{self}: drop {packet_repr} due to drop rate")
+            if log.isEnabledFor(DEBUG):
+                log.debug(f"{self}: drop {packet_kind} {packet} due to drop rate")
             return True, Time.SENTINEL
 
         # add delay
@@ -97,9 +100,9 @@ class BaseChannel[N: Node](Entity):
         """
         if len(self.node_list) != 2:
             raise ValueError(f"{self} does not have exactly 2 nodes")
-        if self.node_list[0] == own:
+        if self.node_list[0] is own:
             return self.node_list[1]
-        if self.node_list[1] == own:
+        if self.node_list[1] is own:
             return self.node_list[0]
         raise ValueError(f"{self} does not connect to {own}")
 
@@ -89,7 +89,8 @@ class ClassicChannel(BaseChannel[Node]):
 
         """
         drop, recv_time = self._send(
-            packet_repr=f"packet {packet}",
+            packet_kind="packet",
+            packet=packet,
             packet_len=len(packet),
             next_hop=next_hop,
         )
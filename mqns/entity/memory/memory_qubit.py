@@ -81,6 +81,10 @@ class QubitState(Enum):
     The link layer may generate a new elementary entanglement into this qubit.
     """
 
+    # Members are singletons compared by identity; the C-level identity hash agrees with equality.
+    # Enum's default hashes the member name in Python code, which is slow for per-transition lookups.
+    __hash__ = object.__hash__
+
 
 ALLOWED_STATE_TRANSITIONS: dict[QubitState, tuple[QubitState, ...]] = {
     QubitState.RAW: (QubitState.ACTIVE,),
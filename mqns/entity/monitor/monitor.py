@@ -58,6 +58,8 @@ class Monitor(Entity):
         self.network = network
         self.attributions: list[tuple[str, AttributionFunc]] = []
         self.records: dict[str, list[Any]] = {"time": []}
+        self._columns: list[tuple[list[Any], AttributionFunc]] = []
+        """Record column and calculation function of each attribution, avoiding per-event lookups in ``records``."""
 
         self.watch_at_start = False
         self.watch_at_finish = False
@@ -84,9 +86,10 @@ class Monitor(Entity):
 
     @override
     def handle(self, event: Event) -> None:
-        self.records["time"].append(self.simulator.tc.sec)
-        for name, calculate_func in self.attributions:
-            self.records[name].append(calculate_func(self.simulator, self.network, event))
+        simulator, network = self.simulator, self.network
+        self.records["time"].append(simulator.tc.sec)
+        for column, calculate_func in self._columns:
+            column.append(calculate_func(simulator, network, event))
 
         if isinstance(event, MonitorEvent) and event.period is not None:
             event.t += event.period
@@ -120,7 +123,8 @@ class Monitor(Entity):
         """
         self.ensure_not_installed()
         self.attributions.append((name, calculate_func))
-        self.records[name] = []
+        self.records[name] = column = []
+        self._columns.append((column, calculate_func))
 
     def at_start(self) -> None:
         """
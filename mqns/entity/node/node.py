@@ -132,8 +132,9 @@ class Node(Entity):
         try:
             return cast(A, self._app_by_type[app_type])
         except KeyError:
-            # app_type is a base class
-            return self._get_app_from_apps(app_type)
+            # app_type is a base class; remember the match because apps cannot change after install
+            app = self._app_by_type[app_type] = self._get_app_from_apps(app_type)
+            return app
 
     def _get_app_from_apps[A: Application](self, app_type: type[A]) -> A:
         apps = self.get_apps(app_type)
@@ -141,7 +141,8 @@ class QuantumChannel(BaseChannel[QNode]):
             NextHopNotConnectionException: next_hop is not connected to this channel.
         """
         drop, recv_time = self._send(
-            packet_repr=f"qubit {qubit}",
+            packet_kind="qubit",
+            packet=qubit,
             packet_len=1,
             next_hop=next_hop,
         )
@@ -1,8 +1,7 @@
+import math
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Self, overload, override
 
-import numpy as np
-
 if TYPE_CHECKING:
     from mqns.models.epr import MixedStateEntanglement, WernerStateEntanglement
     from mqns.models.qubit import Qubit
@@ -91,9 +90,9 @@ class ErrorModel(ABC):
         if p_error is not None:
             p_survival = 1 - p_error
         elif t is not None:
-            p_survival = np.exp(-rate * t)
+            p_survival = math.exp(-rate * t)
         elif length is not None:
-            p_survival = np.exp(-rate * length)
+            p_survival = math.exp(-rate * length)
 
         assert 0 <= p_survival <= 1, "Survival/error probability must be between 0 and 1"
         if self._p_survival != p_survival:
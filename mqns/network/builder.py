@@ -1,3 +1,4 @@
+import copy
 import functools
 import itertools
 from collections.abc import Sequence
@@ -612,10 +613,12 @@ class NetworkBuilder:
 
         This method is only necessary if you need to inspect or modify the topology factory object.
         Otherwise, use ``.make_network()`` directly.
+
+        Each call returns a separate topology with its own copy of the controller applications.
         """
         topo = Topo(qnodes=self.qnodes, qchannels=self.qchannels)
         if len(self.controller_apps) > 0:
-            topo["controller"] = TopoController(name="ctrl", apps=self.controller_apps)
+            topo["controller"] = TopoController(name="ctrl", apps=copy.deepcopy(self.controller_apps))
         return CustomTopology(
             topo,
             nodes_apps=self.qnode_apps,
@@ -630,6 +633,9 @@ class NetworkBuilder:
         """
         Construct quantum network.
 
+        This method may be called repeatedly, such as once per seed replicate of the same scenario.
+        Each call gets its own copy of the route, timing, and controller applications.
+
         Args:
             topo: Result of ``.make_topo()`` method with possible modification, defaults to ``self.make_topo()``.
             connect_controller: If True and controller exists, create cchannels between controller and each qnode.
@@ -640,8 +646,8 @@ class NetworkBuilder:
         net = QuantumNetwork(
             topo,
             classic_topo=ClassicTopology.Follow,
-            route=self.route,
-            timing=self.timing,
+            route=copy.deepcopy(self.route),
+            timing=copy.deepcopy(self.timing),
             epr_type=self.epr_type,
         )
         for src, dst in self.requests:
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from logging import DEBUG
 from typing import TYPE_CHECKING, final, override
 
 from mqns.entity.memory import MemoryQubit, PathDirection
@@ -57,9 +58,11 @@ class CutoffScheme(ABC):
         # Find EPR partner.
         assert qubit.partner
         partner, p_key = qubit.partner
-        log.debug(
-            f"{self.fw}: local cutoff discard key={qubit.key} addr={qubit.addr} round={round} partner={partner.name}:{p_key}"
-        )
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self.fw}: local cutoff discard key={qubit.key} addr={qubit.addr} round={round} "
+                f"partner={partner.name}:{p_key}"
+            )
 
         # Discard primary qubit.
         fw.cnt.increment_n_cutoff(round, True)
@@ -87,10 +90,12 @@ class CutoffScheme(ABC):
         # Find qubit.
         qm_tuple = fw.memory.read(o_key, remove=True)
         if qm_tuple is None:
-            log.debug(f"{self.fw}: remote cutoff discard key={o_key} not exist")
+            if log.isEnabledFor(DEBUG):
+                log.debug(f"{self.fw}: remote cutoff discard key={o_key} not exist")
             return
         qubit, _ = qm_tuple
-        log.debug(f"{self.fw}: remote cutoff discard key={o_key} addr={qubit.addr} round={round}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self.fw}: remote cutoff discard key={o_key} addr={qubit.addr} round={round}")
 
         # Discard secondary qubit.
         fw.cnt.increment_n_cutoff(round, False)
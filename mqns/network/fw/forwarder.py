@@ -17,6 +17,7 @@
 
 import copy
 from abc import abstractmethod
+from logging import DEBUG
 from typing import Literal, TypedDict, Unpack, override
 
 import numpy as np
@@ -465,7 +466,8 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         _, epr = self.memory.read(mq.addr, has=self.epr_type)
         assert not epr.orig_eprs, f"{mq} is not elementary entanglement"
         fib_entry = self.mux.qubit_is_entangled(mq, epr, event.neighbor)
-        log.debug(f"{self}: ENTANGLED {mq} fib_entry={fib_entry} | {epr}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: ENTANGLED {mq} fib_entry={fib_entry} | {epr}")
 
         match mq.state:
             case QubitState.PURIF:
@@ -503,10 +505,11 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
 
         segment_name = f"{self.node.name}-{partner.name}" if own_idx < partner_idx else f"{partner.name}-{self.node.name}"
         want_rounds = fib_entry.purif.get(segment_name, 0)
-        log.debug(
-            f"{self}: segment {segment_name} (qubit {qubit.addr}) has "
-            + f"{qubit.purif_rounds} and needs {want_rounds} purif rounds"
-        )
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self}: segment {segment_name} (qubit {qubit.addr}) has "
+                + f"{qubit.purif_rounds} and needs {want_rounds} purif rounds"
+            )
 
         if qubit.purif_rounds == want_rounds:
             self.cnt.n_eligible += 1
@@ -592,7 +595,8 @@ class Forwarder(ForwarderClassicMixin, Application[QNode]):
         Consume an entangled qubit.
         """
         _, epr = self.memory.read(qubit.addr, has=self.epr_type, remove=True)
-        log.debug(f"{self}: consume EPR: {epr}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: consume EPR: {epr}")
         if epr.consume_with_store_decay_side(self.simulator.tc, side=0 if epr.src is self.node else 1):
             self.cnt.increment_n_consumed(epr.fidelity)
 
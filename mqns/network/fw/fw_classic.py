@@ -1,5 +1,6 @@
 import functools
 from collections.abc import Callable, Mapping
+from logging import DEBUG
 from typing import Any
 
 from mqns.entity.cchannel import ClassicCommandDispatcherMixin, ClassicPacket, classic_cmd_handler
@@ -19,7 +20,8 @@ def fw_control_cmd_handler(cmd: str):
     def decorator(f: Callable[[Any, Any], Any]):
         @functools.wraps(f)
         def wrapper(self: "ForwarderClassicMixin", pkt: ClassicPacket, msg: dict):
-            log.debug(f"{self}: received control message from {pkt.src.name} | {msg}")
+            if log.isEnabledFor(DEBUG):
+                log.debug(f"{self}: received control message from {pkt.src.name} | {msg}")
             f(self, msg)
             return True
 
@@ -49,7 +51,8 @@ def fw_signaling_cmd_handler(cmd: str):
                 self.send_msg(pkt.dest, msg, fib_entry, forward_from=pkt.src)
                 return True
 
-            log.debug(f"{self}: received signaling message from {pkt.src.name} | {msg}")
+            if log.isEnabledFor(DEBUG):
+                log.debug(f"{self}: received signaling message from {pkt.src.name} | {msg}")
             f(self, msg, fib_entry)
             return True
 
@@ -72,7 +75,8 @@ class ForwarderClassicMixin(ClassicCommandDispatcherMixin):
 
     def send_ctrl(self, msg: Mapping):
         ctrl = self.network.get_controller()
-        log.debug(f"{self}: sending control message to controller | {msg}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: sending control message to controller | {msg}")
         self.node.send_cpacket(ctrl, ClassicPacket(msg, src=self.node, dest=ctrl))
 
     def send_msg(self, dest: Node, msg: Mapping, fib_entry: FibEntry, *, forward_from: Node | None = None):
@@ -84,9 +88,10 @@ class ForwarderClassicMixin(ClassicCommandDispatcherMixin):
         next_hop = self.network.get_node(fib_entry.route[nh_idx])
 
         pkt = ClassicPacket(msg, src=forward_from or self.node, dest=dest)
-        via_msg = "" if nh_idx == dest_idx else f" via {next_hop.name}"
-        log.debug(
-            f"{self}: {'forwarding' if forward_from else 'sending'} signaling message "
-            f"from {pkt.src.name} to {pkt.dest.name}{via_msg} | {msg}"
-        )
+        if log.isEnabledFor(DEBUG):
+            via_msg = "" if nh_idx == dest_idx else f" via {next_hop.name}"
+            log.debug(
+                f"{self}: {'forwarding' if forward_from else 'sending'} signaling message "
+                f"from {pkt.src.name} to {pkt.dest.name}{via_msg} | {msg}"
+            )
         self.node.send_cpacket(next_hop, pkt)
@@ -1,3 +1,4 @@
+from logging import DEBUG
 from typing import TYPE_CHECKING
 
 from mqns.entity.memory import MemoryQubit, QuantumMemory, QubitState
@@ -55,10 +56,11 @@ class ForwarderPurifProc:
         epr0.apply_store_decays(now)
         epr1.apply_store_decays(now)
 
-        log.debug(
-            f"{self}: request purif qubit {mq0.addr} (F={epr0.fidelity}) and "
-            + f"{mq1.addr} (F={epr1.fidelity}) with partner {partner.name}"
-        )
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self}: request purif qubit {mq0.addr} (F={epr0.fidelity}) and "
+                + f"{mq1.addr} (F={epr1.fidelity}) with partner {partner.name}"
+            )
 
         # send purif_solicit to partner
         msg: PurifSolicitMsg = {
@@ -107,17 +109,19 @@ class ForwarderPurifProc:
 
         assert msg["partner"] == self.node.name
         primary = self.network.get_node(msg["purif_node"])
-        log.debug(
-            f"{self}: perform purif qubit {mq0.addr} (F={epr0.fidelity}) and "
-            + f"{mq1.addr} (F={epr1.fidelity}) for round {1 + mq0.purif_rounds} with primary {primary.name}"
-        )
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self}: perform purif qubit {mq0.addr} (F={epr0.fidelity}) and "
+                + f"{mq1.addr} (F={epr1.fidelity}) for round {1 + mq0.purif_rounds} with primary {primary.name}"
+            )
 
         # perform purification between EPRs
         result = epr0.purify(epr1, now=self.simulator.tc)
-        log.debug(
-            f"{self}: purif {'succeeded' if result else 'failed'} on qubit {mq0.addr} (F={epr0.fidelity}) "
-            + f"for round {1 + mq0.purif_rounds} with primary {primary.name}"
-        )
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self}: purif {'succeeded' if result else 'failed'} on qubit {mq0.addr} (F={epr0.fidelity}) "
+                + f"for round {1 + mq0.purif_rounds} with primary {primary.name}"
+            )
 
         if result:
             self.memory.write(mq0.addr, epr0, replace=True)
@@ -165,10 +169,11 @@ class ForwarderPurifProc:
         # TODO: handle the exception case when an EPR is decohered and not found in memory
 
         result = msg["result"]
-        log.debug(
-            f"{self}: purif {'succeeded' if result else 'failed'} on qubit {qubit.addr} (F={epr.fidelity}) "
-            + f"for round {1 + qubit.purif_rounds} with partner {msg['partner']}"
-        )
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self}: purif {'succeeded' if result else 'failed'} on qubit {qubit.addr} (F={epr.fidelity}) "
+                + f"for round {1 + qubit.purif_rounds} with partner {msg['partner']}"
+            )
 
         if not result:  # purif failed
             self.fw.release_qubit(qubit, need_remove=True)
@@ -1,5 +1,6 @@
 from collections.abc import Iterable, MutableSequence, Sequence
 from dataclasses import dataclass
+from logging import DEBUG
 from typing import TYPE_CHECKING, ClassVar, cast, override
 
 from mqns.entity.memory import MemoryQubit, QuantumMemory, QubitState
@@ -417,7 +418,8 @@ class ForwarderSwapProc:
             deleted_from.append(f"remote_swapped[{key}]")
         if self.task_by_qubit.pop(key, None):
             deleted_from.append(f"task_by_qubit[{key}]")
-        log.debug(f"{self}: DECOHERE key={mq.key} deleted-from={deleted_from}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: DECOHERE key={mq.key} deleted-from={deleted_from}")
 
     def _heralds(self, heralds: list[SwapHerald]) -> None:
         """
@@ -464,7 +466,8 @@ class ForwarderSwapProc:
             func_to_event(finish_time, self._s_finish, arms, fib_entry, finish_time if self.error_at_finish else now, task)
         )
 
-        log.debug(f"{self}: SWAP_START {task} retrieved-from={task_from} saved-at={task_saved} finish-time={finish_time}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: SWAP_START {task} retrieved-from={task_from} saved-at={task_saved} finish-time={finish_time}")
 
     def _s_get_arms(self, mq0: MemoryQubit, mq1: MemoryQubit) -> Sequence[SwapArm]:
         arms: MutableSequence[SwapArm | None] = [None, None]
@@ -546,7 +549,8 @@ class ForwarderSwapProc:
 
         # Attempt physical swap.
         new_epr, outcome_str, local_success = self._s_physical_swap(error_t, phy_eprs)
-        log.debug(f"{self}: {outcome_str} rank={fib_entry.own_swap_rank} | {arms[0]} x {arms[1]} = {new_epr}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: {outcome_str} rank={fib_entry.own_swap_rank} | {arms[0]} x {arms[1]} = {new_epr}")
 
         # Release consumed qubits.
         for arm in alive_arms:
@@ -559,7 +563,8 @@ class ForwarderSwapProc:
         if task_saved:
             self.sched_expire_task(task)
 
-        log.debug(f"{self}: SWAP_FINISH {task} retrieved-from={task_from} saved-at={task_saved}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: SWAP_FINISH {task} retrieved-from={task_from} saved-at={task_saved}")
         self._heralds(heralds)
 
     def _s_physical_swap(self, swap_start: Time, phy_eprs: Sequence[Entanglement]) -> tuple[Entanglement | None, str, bool]:
@@ -584,7 +589,8 @@ class ForwarderSwapProc:
 
     def _s_physical_deposit(self, new_epr: Entanglement) -> None:
         if new_epr.is_decohered:
-            log.debug(f"{self}: physical deposit skipped reason=DECOHERED")
+            if log.isEnabledFor(DEBUG):
+                log.debug(f"{self}: physical deposit skipped reason=DECOHERED")
             return
 
         deposit_at: list[str] = []
@@ -594,7 +600,8 @@ class ForwarderSwapProc:
             key = new_epr.mem_keys[key_i]
             target.get_app(type(self.fw)).swap.remote_swapped[key] = new_epr
             deposit_at.append(f"{target.name}.remote_swapped[{key}]")
-        log.debug(f"{self}: physical deposit at {', '.join(deposit_at)}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: physical deposit at {', '.join(deposit_at)}")
 
     def pop_waiting_su(self, qubit: MemoryQubit):
         """
@@ -669,21 +676,27 @@ class ForwarderSwapProc:
             if qubit:
                 if expiry == 0:
                     self.fw.cnt.n_su_lower[3] += 1
-                    log.debug(f"{self}: releasing qubit {qubit.addr} reason=lower-swap-failure key={qubit_key} | {new_phy}")
+                    if log.isEnabledFor(DEBUG):
+                        log.debug(f"{self}: releasing qubit {qubit.addr} reason=lower-swap-failure key={qubit_key} | {new_phy}")
                 elif not q_paths:
                     self.fw.cnt.n_su_lower[4] += 1
-                    log.debug(f"{self}: releasing qubit {qubit.addr} reason=lower-swap-conflict key={qubit_key} | {new_phy}")
+                    if log.isEnabledFor(DEBUG):
+                        log.debug(
+                            f"{self}: releasing qubit {qubit.addr} reason=lower-swap-conflict key={qubit_key} | {new_phy}"
+                        )
                 else:
                     self.fw.cnt.n_su_lower[2] += 1
-                    log.debug(
-                        f"{self}: releasing qubit {qubit.addr} reason=lower-expiry "
-                        f"expiry={self.simulator.time(time_slot=expiry)} "
-                        f"key={qubit_key} | {new_phy}"
-                    )
+                    if log.isEnabledFor(DEBUG):
+                        log.debug(
+                            f"{self}: releasing qubit {qubit.addr} reason=lower-expiry "
+                            f"expiry={self.simulator.time(time_slot=expiry)} "
+                            f"key={qubit_key} | {new_phy}"
+                        )
                 self.fw.release_qubit(qubit, need_remove=True)
             else:
                 self.fw.cnt.n_su_lower[1] += 1
-                log.debug(f"{self}: qubit decohered during SWAP_UPDATE transmission key={qubit_key} | {new_phy}")
+                if log.isEnabledFor(DEBUG):
+                    log.debug(f"{self}: qubit decohered during SWAP_UPDATE transmission key={qubit_key} | {new_phy}")
             return
         assert qubit, f"qubit not found for {qubit_key}"
         assert new_phy, f"new_phy not found for {qubit_key}"
@@ -706,10 +719,11 @@ class ForwarderSwapProc:
         self.memory.write(qubit.addr, new_phy, replace=True)
 
         self.fw.cnt.n_su_lower[0] += 1
-        log.debug(
-            f"{self}: segment {cast(QNode, new_phy.src).name}-{cast(QNode, new_phy.dst).name} "
-            f"swap completed for rank {swapper_rank}"
-        )
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self}: segment {cast(QNode, new_phy.src).name}-{cast(QNode, new_phy.dst).name} "
+                f"swap completed for rank {swapper_rank}"
+            )
 
         # Progress toward purification and this-rank swap.
         qubit.purif_rounds = 0
@@ -735,10 +749,11 @@ class ForwarderSwapProc:
             deleted_from = None
             if self.remote_swapped.pop(qubit_key, None):
                 deleted_from = f"remote_swapped[{qubit_key}]"
-            log.debug(
-                f"{self}: SWAP_UPDATE_SAME {task} retrieved-from={task_from} "
-                f"DROPPED reason=previous-swap-failure deleted-from={deleted_from}"
-            )
+            if log.isEnabledFor(DEBUG):
+                log.debug(
+                    f"{self}: SWAP_UPDATE_SAME {task} retrieved-from={task_from} "
+                    f"DROPPED reason=previous-swap-failure deleted-from={deleted_from}"
+                )
             assert task_from == "constructor"
             return
 
@@ -755,7 +770,8 @@ class ForwarderSwapProc:
             mq.epr_path_ids = task.q_paths
 
         self.fw.cnt.n_su_same[0] += 1
-        log.debug(f"{self}: SWAP_UPDATE_SAME {task} retrieved-from={task_from} saved-at={task_saved}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: SWAP_UPDATE_SAME {task} retrieved-from={task_from} saved-at={task_saved}")
         self._heralds(heralds)
 
     def _u_get_task(self, fib_entry: FibEntry, qubit_key: str) -> tuple[SwapTask, str]:
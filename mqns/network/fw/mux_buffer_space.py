@@ -1,5 +1,6 @@
 from abc import abstractmethod
 from collections.abc import Callable
+from logging import DEBUG
 from typing import TYPE_CHECKING, cast, override
 
 from mqns.entity.memory import MemoryQubit, PathDirection, QubitState
@@ -93,7 +94,8 @@ class MuxSchemeBufferSpace(MuxSchemeFibBase):
                 direction,
                 n="all" if n_qubits == 0 else n_qubits,
             )
-        log.debug(f"{self.fw}: allocated {direction} qubits: {addrs}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self.fw}: allocated {direction} qubits: {addrs}")
 
     @override
     def uninstall_path_neighbor(
@@ -103,7 +105,8 @@ class MuxSchemeBufferSpace(MuxSchemeFibBase):
         qubits = self.memory.find(lambda q, _: q.path_id == fib_entry.path_id, qchannel=qchannel)
         addrs = [q[0].addr for q in qubits]
         self.memory.deallocate(*addrs)
-        log.debug(f"{self.fw}: deallocated {direction} qubits: {addrs}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self.fw}: deallocated {direction} qubits: {addrs}")
         pass
 
     @override
@@ -1,8 +1,6 @@
 from collections.abc import Callable
 from typing import cast, override
 
-import numpy as np
-
 from mqns.entity.memory import MemoryQubit, QubitState
 from mqns.entity.node import QNode
 from mqns.models.epr import Entanglement
@@ -15,16 +13,22 @@ from mqns.utils import rng
 
 def _select_path_random(epr: Entanglement, fib: Fib, path_ids: list[int]) -> int:
     _ = epr, fib
-    return rng.choice(path_ids)
+    return path_ids[rng.integers(len(path_ids))]
 
 
 def _select_path_swap_weighted(epr: Entanglement, fib: Fib, path_ids: list[int]) -> FibEntry:
     _ = epr
     entries = [fib.get(pid) for pid in path_ids]
     # fewer swaps (shorter route) means higher weight
-    weights = np.array([1.0 / (1 + len(e.swap)) for e in entries])
-    weights /= np.sum(weights)
-    return entries[rng.choice(len(entries), p=weights)]
+    weights = [1.0 / (1 + len(e.swap)) for e in entries]
+    # inverse-CDF sampling over the few candidates, avoiding per-call NumPy array creation
+    u = rng.random() * sum(weights)
+    acc = 0.0
+    for w, e in zip(weights, entries, strict=True):
+        acc += w
+        if u < acc:
+            return e
+    return entries[-1]
 
 
 class MuxSchemeDynamicEpr(MuxSchemeFibBase, MuxSchemeDynamicBase):
@@ -33,7 +33,7 @@ def select_random[T](candidates: list[T], *_: Any) -> T:
     """
     Candidate selection function that selects a random candidate with uniform probability.
     """
-    return candidates[rng.choice(len(candidates))]
+    return candidates[rng.integers(len(candidates))]
 
 
 type MemoryEprTuple = tuple[MemoryQubit, Entanglement]
@@ -74,4 +74,4 @@ def select_purif_qubit_random(
     candidates: list[MemoryEprTuple],
 ) -> MemoryEprTuple:
     _ = qubit, fib_entry, partner
-    return candidates[rng.choice(len(candidates))]
+    return candidates[rng.integers(len(candidates))]
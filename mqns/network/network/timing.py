@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from collections import deque
 from collections.abc import Sequence
 from enum import Enum, auto
+from logging import DEBUG
 from typing import TYPE_CHECKING, final, overload, override
 
 from mqns.simulator import Event, Time, func_to_event
@@ -186,11 +186,15 @@ class TimingModeSync(TimingMode):
             f"t_ext={self.t_ext.time_slot}, t_rtg={self.t_rtg.time_slot}, t_int={self.t_int.time_slot}"
         )
 
-        self._sequence = deque[tuple[TimingPhase, Time]]()
-        self._sequence.append((TimingPhase.EXTERNAL, self.t_ext))
+        sequence = [(TimingPhase.EXTERNAL, self.t_ext)]
         if t_rtg > 0:
-            self._sequence.append((TimingPhase.ROUTING, self.t_rtg))
-        self._sequence.append((TimingPhase.INTERNAL, self.t_int))
+            sequence.append((TimingPhase.ROUTING, self.t_rtg))
+        sequence.append((TimingPhase.INTERNAL, self.t_int))
+        self._sequence = tuple(sequence)
+        self._seq_index = len(self._sequence) - 1
+
+        # Collect node handlers once; nodes cannot be added after installation.
+        self._node_handlers = [node.handle for node in network.all_nodes]
 
         self.phase = self._sequence[-1][0]
         """Current phase."""
@@ -200,17 +204,15 @@ class TimingModeSync(TimingMode):
         self.simulator.add_event(func_to_event(self.simulator.ts, self._enter_phase))
 
     def _change_phase(self):
-        log.debug(f"TIME_SYNC: exiting {self.phase.name} phase")
-        event = TimingPhaseEvent(self.phase, enter=False, t=self.simulator.tc)
-        for node in self.network.all_nodes:
-            node.handle(event)
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"TIME_SYNC: exiting {self.phase.name} phase")
+        self._signal_phase(TimingPhaseEvent(self.phase, enter=False, t=self.simulator.tc))
 
         self._enter_phase()
 
     def _enter_phase(self):
-        this_phase = self._sequence.popleft()
-        self._sequence.append(this_phase)
-        phase, duration = this_phase
+        self._seq_index = (self._seq_index + 1) % len(self._sequence)
+        phase, duration = self._sequence[self._seq_index]
 
         self.phase = phase
         self.end_time = self.simulator.tc + duration
@@ -218,10 +220,13 @@ class TimingModeSync(TimingMode):
         # schedule next sync signal
         self.simulator.add_event(func_to_event(self.end_time, self._change_phase))
 
-        log.debug(f"TIME_SYNC: entering {phase.name} phase")
-        event = TimingPhaseEvent(phase, enter=True, t=self.simulator.tc)
-        for node in self.network.all_nodes:
-            node.handle(event)
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"TIME_SYNC: entering {phase.name} phase")
+        self._signal_phase(TimingPhaseEvent(phase, enter=True, t=self.simulator.tc))
+
+    def _signal_phase(self, event: TimingPhaseEvent):
+        for handle in self._node_handlers:
+            handle(event)
 
     @override
     def is_async(self) -> bool:
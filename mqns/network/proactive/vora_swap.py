@@ -1,3 +1,4 @@
+import functools
 import math
 from typing import cast
 
@@ -26,7 +27,30 @@ def compute_vora_swap_sequence(
         ps: probability of successful swapping.
         t_cohere: memory coherence time, in seconds.
         qchannel_capacity: qchannel capacity.
+
+    Results for recently seen arguments are memoized.
     """
+    so = _compute_vora_swap_sequence(
+        lengths=tuple(lengths),
+        attempts=tuple(attempts),
+        success=tuple(success),
+        ps=ps,
+        t_cohere=t_cohere,
+        qchannel_capacity=qchannel_capacity,
+    )
+    return list(so)
+
+
+@functools.lru_cache(maxsize=32)
+def _compute_vora_swap_sequence(
+    *,
+    lengths: tuple[float, ...],
+    attempts: tuple[float, ...],
+    success: tuple[float, ...],
+    ps: float,
+    t_cohere: float,
+    qchannel_capacity: int,
+) -> tuple[int, ...]:
     from mqns.network.proactive.vora_utils import get_Bq, merge_close, voraswap  # noqa: PLC0415
 
     assert len(lengths) == len(attempts) == len(success) >= 1
@@ -35,9 +59,9 @@ def compute_vora_swap_sequence(
     assert 1 >= max(success) >= min(success) >= 0
 
     # Gather characteristics of each quantum channel.
-    L_list = merge_close(lengths, 0.50)
-    C0 = merge_close(attempts, 0.50)
-    P = merge_close(success, 0.75)
+    L_list = merge_close(list(lengths), 0.50)
+    C0 = merge_close(list(attempts), 0.50)
+    P = merge_close(list(success), 0.75)
 
     # Compute time slot for the external phase i.e. elementary entanglement establishment.
     T_cutoff = t_cohere
@@ -48,7 +72,7 @@ def compute_vora_swap_sequence(
     C = [round(c * qchannel_capacity * T_ext) for c in C0]
 
     # Compute Binomial coefficients, large enough for the computation.
-    # This function is slow but it has internal file-based caching.
+    # This function is slow but it has internal file-based and in-memory caching.
     Bq = get_Bq(math.ceil(max(C) / 1e3) * 1000, ps)
 
     # Invoke VoraSwap algorithm.
@@ -67,4 +91,4 @@ def compute_vora_swap_sequence(
     for i, j in enumerate(cast(list[int], result["order"])):
         so[j] = i
     so[0] = so[-1] = 1 + max(so)
-    return so
+    return tuple(so)
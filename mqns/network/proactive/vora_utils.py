@@ -1,9 +1,9 @@
+import functools
 import os
 import pickle
 import time
 
 import matplotlib.pyplot as plt
-import networkx as nx
 import numpy as np
 from scipy.stats import binom
 
@@ -108,8 +108,9 @@ def merge_close(numbers: list[float], relative_threshold_percent=0.5) -> list[fl
     return result
 
 
+@functools.lru_cache(maxsize=4)  # each table is (N+1)^2 float64, i.e. 72 MB at N=3000
 def get_Bq(N: int, q=0.5):
-    # get Binomial coeffs
+    # get Binomial coeffs; the returned table is shared and must not be modified
     fname = os.path.join(os.path.dirname(__file__), ".vora_cache", f"B_q{q}_N{N}.pkl")
     if os.path.exists(fname):
         Bq = pickle.load(open(fname, "rb"))
@@ -163,16 +164,19 @@ def bin_pd(n, p, cutoff=1):
 
 def swap_pds(p1, p2, q, cutoff=1, Bq=None):
     # swapping to prob. distributinos
-    Lc = min(len(p1), len(p2))
-    p = np.zeros(Lc)
-    for k in np.arange(Lc):
-        for i in np.arange(k, len(p1)):
-            p2b = 0
-            for j in np.arange(k, len(p2)):
-                if j <= i:
-                    b = binomial(q, j + 1, k + 1) if Bq is None else Bq[j + 1, k + 1]
-                p2b += p2[j] * b
-            p[k] += p1[i] * p2b
+    L1, L2 = len(p1), len(p2)
+    Lc = min(L1, L2)
+    if Bq is None:
+        Bq = np.array([[binomial(q, n, k) for k in range(Lc + 1)] for n in range(max(L1, L2) + 1)])
+
+    # p[k] = sum(p1[i] * p2b[k, i] for i >= k), where
+    # p2b[k, i] = sum(p2[j] * Bq[min(i, j) + 1, k + 1] for j >= k).
+    # This is evaluated with whole-array operations instead of a triple loop over numpy scalars.
+    k = np.arange(Lc)
+    i = np.minimum(np.arange(L1), L2 - 1)
+    p2_tail = np.append(np.cumsum(p2[::-1])[::-1][1:], 0.0)  # p2_tail[i] = sum(p2[i+1:])
+    p2b = np.cumsum(np.triu(p2 * Bq[1 : L2 + 1, 1 : Lc + 1].T), axis=1)[:, i] + Bq[i[:, None] + 1, k + 1].T * p2_tail[i]
+    p = np.triu(p2b * p1).sum(axis=1)
 
     p = approx_pd(p, cutoff)
     EXT = np.dot(1 + np.arange(len(p)), p)
@@ -421,6 +425,8 @@ def net_chain3(L, p=None, q=None, C=None, M=None, note="", unit=""):
 
 
 def plot_path(L_list, M=None, order=None, endnodes=["S", "D"]):
+    import networkx as nx  # noqa: PLC0415  # only needed for plotting
+
     n = len(L_list) + 1
     # Create a graph
     G = nx.Graph()
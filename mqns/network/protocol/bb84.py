@@ -159,7 +159,7 @@ class BB84SendApp(Application[QNode]):
             (QUBIT_STATE_1, BASIS_Z, 1),
             (QUBIT_STATE_P, BASIS_X, 0),
             (QUBIT_STATE_N, BASIS_X, 1),
-        ][rng.choice(4)]
+        ][rng.integers(4)]
 
         id = self.count
         self.count += 1
@@ -453,7 +453,7 @@ class BB84RecvApp(Application[QNode]):
         id = int(qubit.name)
 
         # randomly choose X,Z basis
-        basis = [BASIS_Z, BASIS_X][rng.choice(2)]
+        basis = [BASIS_Z, BASIS_X][rng.integers(2)]
         ret = qubit.measure(basis)
         self.qubit_list[id] = qubit
         self.basis_list[id] = basis
@@ -18,6 +18,7 @@
 from collections import deque
 from collections.abc import Iterable
 from dataclasses import dataclass
+from logging import DEBUG
 from typing import Literal, TypedDict, cast, override
 
 from mqns.entity.cchannel import ClassicChannel, ClassicPacket, RecvClassicPacket
@@ -287,7 +288,8 @@ class LinkLayer(Application[QNode]):
 
         """
         qubits = list(self.memory.find(lambda *_: True, qchannel=qchannel))
-        log.debug(f"{self}: {qchannel.name} has assigned qubits: {qubits}")
+        if log.isEnabledFor(DEBUG):  # skip building qubit/EPR descriptions when not logged
+            log.debug(f"{self}: {qchannel.name} has assigned qubits: {qubits}")
         for qb, data in qubits:
             if qb.path_id != path_id or qb.state is not QubitState.RAW:
                 continue
@@ -426,7 +428,10 @@ class LinkLayer(Application[QNode]):
 
         # If the network uses ASYNC timing mode or the successful attempt can complete within the current EXTERNAL phase,
         # schedule the EPR arrival on both nodes via LinkArchSuccessEvents.
-        log.debug(f"{self}: prepare EPR {epr.name} key={key} dst={epr.dst} attempts={k} notify-times={t_notify_a},{t_notify_b}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(
+                f"{self}: prepare EPR {epr.name} key={key} dst={epr.dst} attempts={k} notify-times={t_notify_a},{t_notify_b}"
+            )
 
         self.simulator.add_event(LinkArchSuccessEvent(self.node, key, epr, t=t_notify_a, attempts=k))
         self.simulator.add_event(LinkArchSuccessEvent(next_hop, key, epr, t=t_notify_b, attempts=k))
@@ -457,7 +462,8 @@ class LinkLayer(Application[QNode]):
     @event_handler
     def handle_release(self, event: QubitReleasedEvent) -> bool:
         qubit = event.qubit
-        log.debug(f"{self}: {event}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self}: {event}")
         qubit.state = QubitState.RAW
 
         assert qubit.qchannel is not None
@@ -17,6 +17,7 @@
 
 from collections import defaultdict, deque
 from itertools import pairwise
+from logging import DEBUG
 from typing import cast, override
 
 from mqns.entity.cchannel import ClassicCommandDispatcherMixin, ClassicPacket, classic_cmd_handler
@@ -102,7 +103,8 @@ class ReactiveRoutingController(ClassicCommandDispatcherMixin, RoutingController
             log.warning(f"{self}: received LS message from {pkt.src} outside of ROUTING phase | {msg}")
             return True
 
-        log.debug(f"{self.node.name}: received LS message from {pkt.src} | {msg}")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"{self.node.name}: received LS message from {pkt.src} | {msg}")
         self.cnt.n_ls += 1
 
         for entry in msg["ls"]:
@@ -92,8 +92,12 @@ class Topo(TypedDict):
     """
 
 
+_CCHANNEL_KEYS = frozenset(ClassicChannelInitKwargs.__annotations__)
+"""Qchannel parameters that are also accepted by the ClassicChannel constructor."""
+
+
 def _qchannel_to_cchannel(qc: TopoQChannel) -> TopoCChannel:
-    parameters = dict(((k, v) for k, v in qc["parameters"].items() if k in ClassicChannelInitKwargs.__annotations__))
+    parameters = {k: v for k, v in qc["parameters"].items() if k in _CCHANNEL_KEYS}
     return {"node1": qc["node1"], "node2": qc["node2"], "parameters": cast(ClassicChannelInitKwargs, parameters)}
 
 
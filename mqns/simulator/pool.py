@@ -25,7 +25,16 @@ class EventPool(ABC):
         """Current time slot."""
         self.te = te
         """End time slot, None means continuous."""
-        self._list: list[Event] = []
+        self._list: list[tuple[int, int, Event]] = []
+        """
+        Heap of ``(time_slot, priority, event)`` entries.
+
+        Tuple keys are compared in C; ``Event.__lt__`` is only called on ties in time slot and priority.
+        Tied events compare as not-less, as before, which keeps seeded runs reproducible.
+        """
+
+    def _make_entry(self, event: Event) -> tuple[int, int, Event]:
+        return (event.t.time_slot, event.priority, event)
 
     def start(self) -> None:
         """Set ``running = True``."""
@@ -74,7 +83,7 @@ class HeapEventPool(EventPool):
 
     @override
     def insert(self, event: Event) -> None:
-        heapq.heappush(self._list, event)
+        heapq.heappush(self._list, self._make_entry(event))
 
     @override
     def pop(self) -> Event | None:
@@ -85,8 +94,7 @@ class HeapEventPool(EventPool):
                 self.tc = self.te
             return None
 
-        event = heapq.heappop(self._list)
-        self.tc = event.t.time_slot
+        self.tc, _, event = heapq.heappop(self._list)
         return event
 
     def __repr__(self):
@@ -128,7 +136,7 @@ class SynchronizedEventPool(EventPool):
     @override
     def insert(self, event: Event) -> None:
         with self._cv:
-            heapq.heappush(self._list, event)
+            heapq.heappush(self._list, self._make_entry(event))
             self._cv.notify_all()  # wake up .pop() if it's waiting for events
 
     @override
@@ -143,10 +151,10 @@ class SynchronizedEventPool(EventPool):
                     return None
 
                 if self._list:  # has events
-                    next_t = self._list[0].t.time_slot
+                    next_t = self._list[0][0]
 
                     if next_t <= self._gate:  # event is before gate and can be executed
-                        event = heapq.heappop(self._list)
+                        _, _, event = heapq.heappop(self._list)
                         self.tc = next_t
                         self._reached = -1
                         return event
@@ -2,6 +2,7 @@ import math
 import os
 import time
 from collections.abc import Callable, Iterable
+from logging import DEBUG
 from pstats import SortKey
 from typing import TYPE_CHECKING, Any, Literal, Protocol, overload
 
@@ -227,7 +228,8 @@ class Simulator:
 
     def _update_gate(self, gate: Time) -> None:
         assert gate.accuracy == self.accuracy
-        log.debug(f"Simulator.update_gate({gate.time_slot})")
+        if log.isEnabledFor(DEBUG):
+            log.debug(f"Simulator.update_gate({gate.time_slot})")
         self._pool.update_gate(gate.time_slot)
 
     def set_gate_reached_handler(self, h: Callable[[int], None]) -> None:
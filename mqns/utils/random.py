@@ -5,7 +5,7 @@ import numpy.random as npr
 _rng = npr.default_rng()
 """
 Real rng instance.
-This may be re-assigned.
+Replace it only through ``rng.reseed()``, which also clears the proxy's cached attributes.
 """
 
 
@@ -16,6 +16,7 @@ class RngUtils:
         """
         global _rng
         _rng = npr.default_rng(npr.PCG64(seed))
+        vars(self).clear()  # drop attributes cached from the previous instance
 
 
 class RngProxy(RngUtils):
@@ -24,7 +25,10 @@ class RngProxy(RngUtils):
     """
 
     def __getattr__(self, name: str) -> Any:
-        return getattr(_rng, name)
+        # Cache the attribute, typically a bound method; later accesses bypass __getattr__.
+        value = getattr(_rng, name)
+        setattr(self, name, value)
+        return value
 
 
 class RngPublic(npr.Generator, RngUtils):
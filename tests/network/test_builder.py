@@ -0,0 +1,22 @@
+from mqns.network.builder import CTRL_DELAY, NetworkBuilder
+from mqns.network.fw import ForwarderConsumeCounters
+from mqns.network.fw.fw_swap import ForwarderSwapProc
+from mqns.network.proactive import ProactiveRoutingController
+from mqns.simulator import Simulator
+
+
+def test_make_network_repeated():
+    ForwarderSwapProc.table_leak_tol = -1
+    b = NetworkBuilder().topo_linear(nodes=3, channels=[10, 10], t_cohere=0.01).proactive_centralized().request("S-D")
+
+    nets = [b.make_network() for _ in range(2)]
+    assert nets[0].get_controller().get_app(ProactiveRoutingController) is not nets[1].get_controller().get_app(
+        ProactiveRoutingController
+    )
+    assert nets[0].route is not nets[1].route
+    assert nets[0].timing is not nets[1].timing
+
+    for net in nets:
+        s = Simulator(0, 0.1 + CTRL_DELAY, accuracy=1000000, install_to=(net,))
+        s.run()
+        assert ForwarderConsumeCounters.of_path(net, "S", "D").n_consumed > 0
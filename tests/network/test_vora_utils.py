@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from mqns.network.proactive.vora_utils import approx_pd, bin_pd, binomial, swap_pds
+
+
+def swap_pds_loop(p1, p2, q, cutoff=1, Bq=None):
+    """Reference triple-loop implementation of ``swap_pds``."""
+    Lc = min(len(p1), len(p2))
+    p = np.zeros(Lc)
+    for k in range(Lc):
+        for i in range(k, len(p1)):
+            p2b = 0
+            for j in range(k, len(p2)):
+                if j <= i:  # for j > i, the coefficient of j == i is reused
+                    b = binomial(q, j + 1, k + 1) if Bq is None else Bq[j + 1, k + 1]
+                p2b += p2[j] * b
+            p[k] += p1[i] * p2b
+
+    p = approx_pd(p, cutoff)
+    return np.dot(1 + np.arange(len(p)), p), p
+
+
+def make_Bq(N: int, q: float) -> np.ndarray:
+    Bq = np.zeros((N + 1, N + 1))
+    for k in range(N + 1):
+        Bq[k, k] = 1 if k == 0 else Bq[k - 1, k - 1] * q
+        for n in range(k, N):
+            Bq[n + 1, k] = Bq[n, k] * (1 - q) * (n + 1) / (n + 1 - k)
+    return Bq
+
+
+@pytest.mark.parametrize(
+    ("n1", "p1", "n2", "p2", "q", "cutoff"),
+    [
+        (12, 0.3, 12, 0.3, 0.5, 1),  # symmetric
+        (40, 0.2, 15, 0.6, 0.5, 1),  # L1 > L2
+        (8, 0.9, 30, 0.1, 0.7, 1),  # L1 < L2
+        (150, 0.25, 120, 0.4, 0.5, 0.9995),  # tail truncation
+    ],
+)
+@pytest.mark.parametrize("with_Bq", [True, False])
+def test_swap_pds(*, n1: int, p1: float, n2: int, p2: float, q: float, cutoff: float, with_Bq: bool):
+    d1 = bin_pd(n1, p1, cutoff)
+    d2 = bin_pd(n2, p2, cutoff)
+    Bq = make_Bq(max(n1, n2) + 1, q) if with_Bq else None
+
+    ext, p = swap_pds(d1, d2, q, cutoff, Bq)
+    ext_ref, p_ref = swap_pds_loop(d1, d2, q, cutoff, Bq)
+
+    assert len(p) == len(p_ref)
+    assert np.allclose(p, p_ref, rtol=0, atol=1e-14)
+    assert ext == pytest.approx(ext_ref, rel=1e-12)